@@ -13,6 +13,7 @@ Rules implemented:
 Author: ChatGPT (GPT-5 Thinking mini)
 """
 
+import numpy as np
 import pygame
 import random
 import time
@@ -39,14 +40,38 @@ CORRECT_GREEN = (20, 160, 80)
 WRONG_RED = (220, 60, 60)
 BUTTON_COLOR = (30, 40, 60)
 BUTTON_HOVER = (50, 70, 100)
+ARROW_COLOR = (60, 60, 80)
+FADED_WORD_COLOR = (100, 100, 110)     # stimulus word under the feedback overlay
+FADED_ARROW_COLOR = (140, 140, 150)    # arrow under the feedback overlay
 
 # ------------------------------------------------
 
+# Fixed layout (built once, shared by every frame)
+CARD_RECT = pygame.Rect(140, 120, SCREEN_SIZE[0]-280, 360)        # stimulus card
+HUD_RECT_BG = pygame.Rect(130, 40, SCREEN_SIZE[0]-260, 14)        # progress bar track
+INFO_CARD_RECT = pygame.Rect(120, 220, SCREEN_SIZE[0]-240, 260)   # start-screen info card
+WORD_CENTER = (SCREEN_SIZE[0]//2, SCREEN_SIZE[1]//2 - 20)
+ARROW_CENTERS = (                                                  # indexed by random_variant
+    (SCREEN_SIZE[0]//2 - 220, SCREEN_SIZE[1]//2 - 10),
+    (SCREEN_SIZE[0]//2 + 220, SCREEN_SIZE[1]//2 - 10),
+)
+
 pygame.init()
 screen = pygame.display.set_mode(SCREEN_SIZE)
 pygame.display.set_caption("Directional / Spatial Stroop — Spatial Attention")
 clock = pygame.time.Clock()
 
+# Only these events are ever handled; SDL drops everything else (mouse-motion spam etc.)
+# before it reaches the queue. Hover reads pygame.mouse.get_pos() instead.
+INPUT_EVENTS = [pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN]
+pygame.event.set_blocked(None)
+pygame.event.set_allowed(INPUT_EVENTS)
+pygame.event.set_allowed(pygame.VIDEOEXPOSE)  # repaint static screens after being uncovered
+
+# Key dispatch tables
+_KEY_RESPONSE = {pygame.K_LEFT: "LEFT", pygame.K_RIGHT: "RIGHT"}
+_END_ACTIONS = {pygame.K_r: "restart", pygame.K_q: "quit"}
+
 # Fonts
 def font(size, bold=False):
     return pygame.font.SysFont(FONT_NAME, size, bold=bold)
@@ -56,21 +81,75 @@ WORD_FONT = font(84, True)
 SMALL_FONT = font(22)
 BUTTON_FONT = font(28, True)
 
+# Rendered text cache: static strings are rasterized once, the frame loop only blits
+_TEXT_CACHE = {}
+
+def text(s, fnt, color):
+    key = (id(fnt), s, color)
+    r = _TEXT_CACHE.get(key)
+    if r is None:
+        r = fnt.render(s, True, color).convert_alpha()
+        _TEXT_CACHE[key] = r
+    return r
+
+TITLE_TEXT = "Directional / Spatial Stroop"
+SUBTITLE_TEXT = "Respond to the WORD (not the arrow). Click or press ← / →"
+INFO_LINES = [
+    f"Trials: {TRIALS}    Stimulus: {STIMULUS_DURATION}s    Fixation: {FIXATION_DURATION}s",
+    "Scoring: +1 for correct (word). Reaction time recorded.",
+    "Controls: Click LEFT / RIGHT buttons or press Left and Right arrow keys.",
+    "Arrow distractor is shown to challenge spatial attention.",
+    "Press SPACE to start."
+]
+
+text(TITLE_TEXT, TITLE_FONT, CARD_COLOR)
+text(SUBTITLE_TEXT, SMALL_FONT, CARD_COLOR)
+for _line in INFO_LINES:
+    text(_line, SMALL_FONT, TEXT_COLOR)
+for _word in ("LEFT", "RIGHT"):
+    text(_word, WORD_FONT, TEXT_COLOR)
+    text(_word, WORD_FONT, FADED_WORD_COLOR)
+text("Correct!", TITLE_FONT, CORRECT_GREEN)
+text("Wrong!", TITLE_FONT, WRONG_RED)
+text("Too Slow!", TITLE_FONT, WRONG_RED)
+text("Session complete!", TITLE_FONT, CARD_COLOR)
+text(f"Trials: {TRIALS}", SMALL_FONT, CARD_COLOR)
+text("Press R to restart or Q to quit.", SMALL_FONT, CARD_COLOR)
+
+# Rounded-rect cache: each fixed-size rounded rect is rasterized once, then blitted
+_RRECT_CACHE = {}
+
+def rrect(w, h, radius, color):
+    key = (w, h, radius, color)
+    img = _RRECT_CACHE.get(key)
+    if img is None:
+        img = pygame.Surface((w, h), pygame.SRCALPHA)
+        pygame.draw.rect(img, color, img.get_rect(), border_radius=radius)
+        img = img.convert_alpha()
+        _RRECT_CACHE[key] = img
+    return img
+
 # Button class for clicking
 class Button:
     def __init__(self, rect, text):
         self.rect = pygame.Rect(rect)
         self.text = text
         self.hot = False
+        self.text_surf = BUTTON_FONT.render(text, True, TEXT_COLOR).convert_alpha()
+        # complete button faces (frame + inner card + label) for both states
+        self.idle_surf = self._face(BUTTON_COLOR)
+        self.hover_surf = self._face(BUTTON_HOVER)
 
-    def draw(self, surf):
-        color = BUTTON_HOVER if self.hot else BUTTON_COLOR
-        pygame.draw.rect(surf, color, self.rect, border_radius=12)
+    def _face(self, color):
+        face = rrect(self.rect.w, self.rect.h, 12, color).copy()
         # inner card
-        inner = self.rect.inflate(-6, -6)
-        pygame.draw.rect(surf, CARD_COLOR, inner, border_radius=10)
-        txt = BUTTON_FONT.render(self.text, True, TEXT_COLOR)
-        surf.blit(txt, txt.get_rect(center=self.rect.center))
+        inner = face.get_rect().inflate(-6, -6)
+        face.blit(rrect(inner.w, inner.h, 10, CARD_COLOR), inner)
+        face.blit(self.text_surf, self.text_surf.get_rect(center=face.get_rect().center))
+        return face
+
+    def draw(self, surf):
+        surf.blit(self.hover_surf if self.hot else self.idle_surf, self.rect)
 
     def update(self, mpos):
         self.hot = self.rect.collidepoint(mpos)
@@ -78,24 +157,39 @@ class Button:
     def clicked(self, mpos):
         return self.rect.collidepoint(mpos)
 
-# Utility to draw gradient background
+# Pre-render the gradient background once; the frame loop only blits it
+def make_gradient(size, top_color, bottom_color):
+    # 2x2 seed (top row / bottom row) stretched with smoothscale's bilinear filter.
+    # Both ends are explicit 32-bit surfaces (smoothscale's requirement); the result
+    # is converted to whatever format the display uses.
+    small = pygame.Surface((2, 2), 0, 32)
+    px = pygame.PixelArray(small)
+    px[:, 0] = top_color
+    px[:, 1] = bottom_color
+    del px
+    dest = pygame.Surface(size, 0, 32)
+    pygame.transform.smoothscale(small, size, dest_surface=dest)
+    return dest.convert()
+
+# Vectorized gradient fill, for gradients that change at runtime
 def draw_gradient(surf, top_color, bottom_color):
     w, h = surf.get_size()
-    for y in range(h):
-        t = y / (h - 1)
-        color = (
-            int(top_color[0] * (1 - t) + bottom_color[0] * t),
-            int(top_color[1] * (1 - t) + bottom_color[1] * t),
-            int(top_color[2] * (1 - t) + bottom_color[2] * t),
-        )
-        pygame.draw.line(surf, color, (0, y), (w, y))
-
-# Draw arrow as polygon
-def draw_arrow(surface, center, size, direction, color=TEXT_COLOR):
+    t = np.linspace(0, 1, h, dtype=np.float32)[:, None]
+    rgb = (np.array(top_color) * (1 - t) + np.array(bottom_color) * t).astype(np.uint8)
+    # fill a 32-bit buffer, then let blit convert to the target's depth (any bpp)
+    buf = pygame.Surface((w, h), 0, 32)
+    pygame.surfarray.blit_array(buf, np.broadcast_to(rgb[None, :, :], (w, h, 3)))
+    surf.blit(buf, (0, 0))
+
+BG_SURFACE = make_gradient(SCREEN_SIZE, BG_TOP, BG_BOTTOM)
+
+# Rasterize an arrow polygon once into its own alpha surface
+def make_arrow(size, direction, color):
     # direction: "LEFT" or "RIGHT"
-    cx, cy = center
     w = size * 1.6
     h = size
+    surf = pygame.Surface((int(w) + 4, int(h) + 4), pygame.SRCALPHA)
+    cx, cy = surf.get_width() // 2, surf.get_height() // 2
     if direction == "RIGHT":
         points = [
             (cx - w/2, cy - h/2),
@@ -114,323 +208,368 @@ def draw_arrow(surface, center, size, direction, color=TEXT_COLOR):
             (cx + w/2, cy + h/2),
             (cx + w/2 - h*0.2, cy)
         ]
-    pygame.draw.polygon(surface, color, points)
-    pygame.draw.polygon(surface, (0,0,0,40), points, 2)
+    pygame.draw.polygon(surf, color, points)
+    # outline is opaque, matching how it looked when drawn straight onto the display
+    pygame.draw.polygon(surf, (0,0,0), points, 2)
+    return surf.convert_alpha()
+
+ARROW_SIZE = 46
+ARROW_SURFS = {}
+for _dir in ("LEFT", "RIGHT"):
+    for _color in (ARROW_COLOR, FADED_ARROW_COLOR):
+        ARROW_SURFS[(_dir, _color)] = make_arrow(ARROW_SIZE, _dir, _color)
+
+# Look up (or build on first use) a pre-rendered arrow surface
+def arrow_surf(direction, color=TEXT_COLOR):
+    img = ARROW_SURFS.get((direction, color))
+    if img is None:
+        img = ARROW_SURFS[(direction, color)] = make_arrow(ARROW_SIZE, direction, color)
+    return img
+
+# Issue a whole list of (surface, dest) pairs in one call; pygame-ce has the faster fblits
+if hasattr(pygame.Surface, "fblits"):
+    def blit_all(surf, seq):
+        surf.fblits(seq)
+else:
+    def blit_all(surf, seq):
+        surf.blits(seq, doreturn=0)
 
 # Build trials
+_CONGRUENT = (("LEFT", "LEFT"), ("RIGHT", "RIGHT"))
+_INCONGRUENT = (("LEFT", "RIGHT"), ("RIGHT", "LEFT"))
+
 def make_trials(n, congruency_prop=0.5):
-    trials = []
     n_congruent = int(round(n * congruency_prop))
     n_incongruent = n - n_congruent
-    for _ in range(n_congruent):
-        word = random.choice(["LEFT", "RIGHT"])
-        arrow = word  # congruent
-        trials.append((word, arrow))
-    for _ in range(n_incongruent):
-        word = random.choice(["LEFT", "RIGHT"])
-        arrow = "LEFT" if word == "RIGHT" else "RIGHT"
-        trials.append((word, arrow))
+    getbit = random.getrandbits
+    trials = [_CONGRUENT[getbit(1)] for _ in range(n_congruent)]
+    trials += [_INCONGRUENT[getbit(1)] for _ in range(n_incongruent)]
     random.shuffle(trials)
     return trials
 
+# Uniform darkening layer for the feedback screen (never changes, so built once)
+_FB_OVERLAY = pygame.Surface(SCREEN_SIZE, pygame.SRCALPHA).convert_alpha()
+_FB_OVERLAY.fill((0,0,0,80))
+
 # Feedback draw
-def draw_feedback(surf, text, correct):
-    overlay = pygame.Surface(surf.get_size(), pygame.SRCALPHA)
-    overlay.fill((0,0,0,80))
-    surf.blit(overlay, (0,0))
-    big = TITLE_FONT.render(text, True, CORRECT_GREEN if correct else WRONG_RED)
+def draw_feedback(surf, msg, correct):
+    surf.blit(_FB_OVERLAY, (0,0))
+    big = text(msg, TITLE_FONT, CORRECT_GREEN if correct else WRONG_RED)
     surf.blit(big, big.get_rect(center=(SCREEN_SIZE[0]//2, SCREEN_SIZE[1]//2)))
 
 # On-screen controls
 left_button = Button((130, SCREEN_SIZE[1] - 120, 180, 80), "LEFT")
 right_button = Button((SCREEN_SIZE[0] - 310, SCREEN_SIZE[1] - 120, 180, 80), "RIGHT")
 
+# Per-trial results, stored column-wise: one list/array per field, indexed by trial.
+# rt is NaN for misses.
+def new_results(n):
+    return {
+        'word': [None] * n,
+        'arrow': [None] * n,
+        'response': [None] * n,
+        'correct': np.zeros(n, dtype=bool),
+        'rt': np.full(n, np.nan),
+    }
+
+def record_result(results, i, word, arrow, response, correct, rt=None):
+    results['word'][i] = word
+    results['arrow'][i] = arrow
+    results['response'][i] = response
+    results['correct'][i] = correct
+    if rt is not None:
+        results['rt'][i] = rt
+
 # Main game loop variables
 trials = make_trials(TRIALS, CONGRUENCY_PROPORTION)
 trial_index = 0
 score = 0
-results = []  # list of dicts with trial info
+results = new_results(TRIALS)
 state = "start"  # states: start, fixation, stimulus, feedback, finished
 state_time = 0
 stim_onset = None
 
 # Start screen
 def draw_start(surf):
-    draw_gradient(surf, BG_TOP, BG_BOTTOM)
-    title = TITLE_FONT.render("Directional / Spatial Stroop", True, CARD_COLOR)
-    subtitle = SMALL_FONT.render("Respond to the WORD (not the arrow). Click or press ← / →", True, CARD_COLOR)
+    surf.blit(BG_SURFACE, (0, 0))
+    title = text(TITLE_TEXT, TITLE_FONT, CARD_COLOR)
+    subtitle = text(SUBTITLE_TEXT, SMALL_FONT, CARD_COLOR)
     surf.blit(title, title.get_rect(center=(SCREEN_SIZE[0]//2, 120)))
     surf.blit(subtitle, subtitle.get_rect(center=(SCREEN_SIZE[0]//2, 170)))
     # info card
-    card = pygame.Rect(120, 220, SCREEN_SIZE[0]-240, 260)
-    pygame.draw.rect(surf, CARD_COLOR, card, border_radius=16)
-    info_lines = [
-        f"Trials: {TRIALS}    Stimulus: {STIMULUS_DURATION}s    Fixation: {FIXATION_DURATION}s",
-        "Scoring: +1 for correct (word). Reaction time recorded.",
-        "Controls: Click LEFT / RIGHT buttons or press Left and Right arrow keys.",
-        "Arrow distractor is shown to challenge spatial attention.",
-        "Press SPACE to start."
-    ]
-    for i, line in enumerate(info_lines):
-        txt = SMALL_FONT.render(line, True, TEXT_COLOR)
+    card = INFO_CARD_RECT
+    surf.blit(rrect(card.w, card.h, 16, CARD_COLOR), card)
+    for i, line in enumerate(INFO_LINES):
+        txt = text(line, SMALL_FONT, TEXT_COLOR)
         surf.blit(txt, (card.x + 28, card.y + 28 + i*42))
 
-# Draw progress and score
-def draw_hud(surf, idx, total, score):
-    # progress bar
-    bar_w = SCREEN_SIZE[0] - 260
-    bar_h = 14
-    x = 130
-    y = 40
-    pygame.draw.rect(surf, (255,255,255,30), (x, y, bar_w, bar_h), border_radius=8)
-    fill = int(bar_w * (idx/total))
-    pygame.draw.rect(surf, ACCENT, (x, y, fill, bar_h), border_radius=8)
-    # score
+# Empty progress bar track (static, baked into the templates below).
+# Opaque white: that is how the old (255,255,255,30) looked drawn straight onto the display.
+def draw_hud_track(surf):
+    surf.blit(rrect(HUD_RECT_BG.w, HUD_RECT_BG.h, 8, (255,255,255)), HUD_RECT_BG)
+
+# Progress bar fill
+def draw_hud_fill(surf, idx, total):
+    fill = int(HUD_RECT_BG.w * (idx/total))
+    surf.blit(rrect(fill, HUD_RECT_BG.h, 8, ACCENT), HUD_RECT_BG)
+
+# Trial / score line above the progress bar, as a (surface, dest) blit pair
+def hud_text(idx, total, score):
     scr = SMALL_FONT.render(f"Trial {idx}/{total}    Score: {score}", True, CARD_COLOR)
-    surf.blit(scr, (x, y - 28))
+    return scr, (HUD_RECT_BG.x, HUD_RECT_BG.y - 28)
 
-# Main render for a stimulus trial
-def draw_trial_screen(surf, word, arrow, time_left=None):
-    draw_gradient(surf, BG_TOP, BG_BOTTOM)
-    # HUD
-    draw_hud(surf, trial_index+1, TRIALS, score)
-    # central card for stimulus
-    card = pygame.Rect(140, 120, SCREEN_SIZE[0]-280, 360)
-    pygame.draw.rect(surf, CARD_COLOR, card, border_radius=18)
-    # word text
-    wtxt = WORD_FONT.render(word, True, TEXT_COLOR)
-    surf.blit(wtxt, wtxt.get_rect(center=(SCREEN_SIZE[0]//2, SCREEN_SIZE[1]//2 - 20)))
-    # arrow distractor on left/right side of word
-    if SHOW_ARROW:
-        arrow_x = SCREEN_SIZE[0]//2 - 220 if random_variant == 0 else SCREEN_SIZE[0]//2 + 220
-        # We'll place arrow on a consistent side based on arrow_side for variety
-        draw_arrow(surf, (arrow_x, SCREEN_SIZE[1]//2 - 10), 46, arrow, color=(60,60,80))
-    # buttons
-    mpos = pygame.mouse.get_pos()
-    left_button.update(mpos)
-    right_button.update(mpos)
-    left_button.draw(surf)
-    right_button.draw(surf)
+# Draw progress and score (track not included)
+def draw_hud(surf, idx, total, score):
+    draw_hud_fill(surf, idx, total)
+    surf.blit(*hud_text(idx, total, score))
+
+# Draw a button only when hovered; the idle state is baked into STIM_TEMPLATE
+def draw_button_hover(surf, button, mpos):
+    button.update(mpos)
+    if button.hot:
+        button.draw(surf)
+
+# Static layers of the trial screens, composited once per game:
+# CARD_TEMPLATE = background + HUD track + stimulus card (feedback screen)
+# STIM_TEMPLATE = CARD_TEMPLATE + idle buttons (stimulus screen)
+CARD_TEMPLATE = pygame.Surface(SCREEN_SIZE).convert()
+CARD_TEMPLATE.blit(BG_SURFACE, (0, 0))
+draw_hud_track(CARD_TEMPLATE)
+CARD_TEMPLATE.blit(rrect(CARD_RECT.w, CARD_RECT.h, 18, CARD_COLOR), CARD_RECT)
+STIM_TEMPLATE = CARD_TEMPLATE.copy()
+left_button.draw(STIM_TEMPLATE)
+right_button.draw(STIM_TEMPLATE)
+
+# We'll add slight variation: arrow side alternate (0 = left of the word, 1 = right)
+random_variant = 0
+
+# Main render for a stimulus trial, shared by the stimulus and feedback screens.
+# time_left adds the countdown (stimulus); feedback=(msg, correct) swaps in the
+# button-less template and darkens the frame with the feedback message on top.
+def render_stimulus(surf, word, arrow, word_color, arrow_color, time_left=None, feedback=None):
+    # template, HUD text, word, timer (and arrow) go out in a single blits call
+    wtxt = text(word, WORD_FONT, word_color)
+    blit_seq = [
+        (CARD_TEMPLATE if feedback else STIM_TEMPLATE, (0, 0)),
+        hud_text(trial_index+1, TRIALS, score),
+        (wtxt, wtxt.get_rect(center=WORD_CENTER)),
+    ]
     # timer small
     if time_left is not None:
         ttxt = SMALL_FONT.render(f"{time_left:.2f}s left", True, TEXT_COLOR)
-        surf.blit(ttxt, (SCREEN_SIZE[0]//2 - 40, SCREEN_SIZE[1]-40))
-
-# We'll add slight variation: arrow side alternate
-random_variant = 0
+        blit_seq.append((ttxt, (SCREEN_SIZE[0]//2 - 40, SCREEN_SIZE[1]-40)))
+    # arrow distractor on left/right side of word
+    if SHOW_ARROW:
+        aimg = arrow_surf(arrow, arrow_color)
+        blit_seq.append((aimg, aimg.get_rect(center=ARROW_CENTERS[random_variant])))
+    blit_all(surf, blit_seq)
+    draw_hud_fill(surf, trial_index+1, TRIALS)
+    if feedback is not None:
+        draw_feedback(surf, *feedback)
 
 # Fixation draw
 def draw_fixation(surf):
-    draw_gradient(surf, BG_TOP, BG_BOTTOM)
+    surf.blit(BG_SURFACE, (0, 0))
+    draw_hud_track(surf)
     draw_hud(surf, trial_index+1, TRIALS, score)
     # fixation cross
-    cx, cy = SCREEN_SIZE[0]//2, SCREEN_SIZE[1]//2 - 20
+    cx, cy = WORD_CENTER
     pygame.draw.line(surf, CARD_COLOR, (cx-14, cy), (cx+14, cy), 5)
     pygame.draw.line(surf, CARD_COLOR, (cx, cy-14), (cx, cy+14), 5)
 
-# End screen
+# End screen, composed once per session and then blitted as one surface
+_finished_img = None
+
 def draw_finished(surf):
-    draw_gradient(surf, BG_TOP, BG_BOTTOM)
-    title = TITLE_FONT.render("Session complete!", True, CARD_COLOR)
-    surf.blit(title, title.get_rect(center=(SCREEN_SIZE[0]//2, 120)))
-    score_text = SMALL_FONT.render(f"Score: {score} / {TRIALS}", True, CARD_COLOR)
-    surf.blit(score_text, score_text.get_rect(center=(SCREEN_SIZE[0]//2, 180)))
-    # Show simple summary table
-    lines = [
-        f"Trials: {TRIALS}",
-        f"Average RT (correct): {calc_avg_rt():.3f} s" if any(r['correct'] for r in results) else "No correct responses.",
-        "Press R to restart or Q to quit."
-    ]
-    for i, l in enumerate(lines):
-        surf.blit(SMALL_FONT.render(l, True, CARD_COLOR), (SCREEN_SIZE[0]//2 - 200, 240 + i*40))
+    global _finished_img
+    if _finished_img is None:
+        avg = calc_avg_rt()
+        img = BG_SURFACE.copy()
+        title = text("Session complete!", TITLE_FONT, CARD_COLOR)
+        img.blit(title, title.get_rect(center=(SCREEN_SIZE[0]//2, 120)))
+        score_text = SMALL_FONT.render(f"Score: {score} / {TRIALS}", True, CARD_COLOR)
+        img.blit(score_text, score_text.get_rect(center=(SCREEN_SIZE[0]//2, 180)))
+        # Show simple summary table
+        lines = [
+            text(f"Trials: {TRIALS}", SMALL_FONT, CARD_COLOR),
+            SMALL_FONT.render(f"Average RT (correct): {avg:.3f} s" if avg>0 else "Average RT (correct): N/A", True, CARD_COLOR),
+            text("Press R to restart or Q to quit.", SMALL_FONT, CARD_COLOR)
+        ]
+        for i, l in enumerate(lines):
+            img.blit(l, (SCREEN_SIZE[0]//2 - 200, 240 + i*40))
+        _finished_img = img
+    surf.blit(_finished_img, (0, 0))
 
 def calc_avg_rt():
-    if not results:
-        return 0.0
-    correct_rts = [r['rt'] for r in results if r['correct']]
-    if not correct_rts:
-        return 0.0
-    return sum(correct_rts)/len(correct_rts)
+    rts = results['rt'][results['correct']]
+    return float(rts.mean()) if rts.size else 0.0
+
+# ---- State handlers -------------------------------------------------
+# Each state has an event handler (input states only), an update handler for
+# timed transitions and a draw handler. They share the module-level game state
+# above plus the per-frame t / mpos sampled in the main loop.
+
+def _start_session():
+    global trial_index, score, results, trials, state, state_time, random_variant, _finished_img
+    _finished_img = None  # new session, new summary
+    trial_index = 0
+    score = 0
+    results = new_results(TRIALS)
+    trials = make_trials(TRIALS, CONGRUENCY_PROPORTION)
+    state = "fixation"
+    state_time = t
+    random_variant = random.getrandbits(1)
+
+def _handle_start_event(event):
+    if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
+        _start_session()
+    elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+        # start on click too
+        _start_session()
+
+def _handle_stimulus_event(event):
+    global score, state, state_time
+    # handle responses
+    response = None
+    if event.type == pygame.KEYDOWN:
+        response = _KEY_RESPONSE.get(event.key)
+    elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+        if left_button.clicked(event.pos):
+            response = "LEFT"
+        elif right_button.clicked(event.pos):
+            response = "RIGHT"
+    if response is None:
+        return
+
+    rt = t - stim_onset
+    correct = (response == current_word)  # **CRITICAL**: correctness judged by WORD (not arrow)
+    if correct:
+        score += 1
+    record_result(results, trial_index, current_word, current_arrow, response, correct, rt)
+    # go to feedback
+    state = "feedback"
+    state_time = t
+
+def _handle_finished_event(event):
+    global state, running
+    if event.type != pygame.KEYDOWN:
+        return
+    action = _END_ACTIONS.get(event.key)
+    if action == "restart":
+        state = "start"
+    elif action == "quit":
+        running = False
+
+def _update_fixation():
+    global state, state_time, stim_onset, current_word, current_arrow, random_variant
+    if t - state_time >= FIXATION_DURATION:
+        # move to stimulus
+        state = "stimulus"
+        state_time = t
+        stim_onset = t  # provisional; re-stamped after the first stimulus flip
+        current_word, current_arrow = trials[trial_index]
+        # Choose arrow side variant
+        random_variant = random.getrandbits(1)
+
+def _update_stimulus():
+    global state, state_time
+    # time out (no response)
+    if t - stim_onset >= STIMULUS_DURATION:
+        # record miss as wrong (rt stays NaN)
+        record_result(results, trial_index, current_word, current_arrow, None, False)
+        state = "feedback"
+        state_time = t
+
+def _update_feedback():
+    global state, state_time, trial_index
+    # wait for FEEDBACK_DURATION then next trial / finish
+    if t - state_time >= FEEDBACK_DURATION:
+        trial_index += 1
+        if trial_index >= TRIALS:
+            state = "finished"
+        else:
+            state = "fixation"
+        state_time = t
+
+def _draw_stimulus():
+    # compute time left for display
+    time_left = max(0.0, STIMULUS_DURATION - (t - stim_onset))
+    render_stimulus(screen, current_word, current_arrow, TEXT_COLOR, ARROW_COLOR, time_left=time_left)
+    # buttons
+    draw_button_hover(screen, left_button, mpos)
+    draw_button_hover(screen, right_button, mpos)
+
+def _draw_feedback():
+    # draw the last stimulus faintly under the feedback overlay
+    last_correct = results['correct'][trial_index]
+    fb_text = "Correct!" if last_correct else ("Too Slow!" if results['response'][trial_index] is None else "Wrong!")
+    render_stimulus(screen, results['word'][trial_index], results['arrow'][trial_index],
+                    FADED_WORD_COLOR, FADED_ARROW_COLOR, feedback=(fb_text, last_correct))
+
+# fixation and feedback take no input: their events are drained, not dispatched
+_EVENT_HANDLERS = {
+    "start": _handle_start_event,
+    "stimulus": _handle_stimulus_event,
+    "finished": _handle_finished_event,
+}
+_UPDATE_HANDLERS = {
+    "fixation": _update_fixation,
+    "stimulus": _update_stimulus,
+    "feedback": _update_feedback,
+}
+_DRAW_HANDLERS = {
+    "start": lambda: draw_start(screen),
+    "fixation": lambda: draw_fixation(screen),
+    "stimulus": _draw_stimulus,
+    "feedback": _draw_feedback,
+    "finished": lambda: draw_finished(screen),
+}
 
 # Main loop
 running = True
+dirty = True
+drawn_state = None
+t = time.perf_counter()
+mpos = (0, 0)
 while running:
     dt = clock.tick(FPS) / 1000.0
-    t = time.time()
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
+    # sampled once per frame and shared by event handling and drawing
+    t = time.perf_counter()
+    mpos = pygame.mouse.get_pos()
+    if state not in _EVENT_HANDLERS:
+        # nothing clickable: only honour QUIT and drop the rest (no early responses)
+        if pygame.event.peek(pygame.QUIT):
             running = False
-
-        if state == "start":
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
-                trial_index = 0
-                score = 0
-                results = []
-                trials = make_trials(TRIALS, CONGRUENCY_PROPORTION)
-                state = "fixation"
-                state_time = t
-                random_variant = random.randint(0, 1)
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                # start on click too
-                trial_index = 0
-                score = 0
-                results = []
-                trials = make_trials(TRIALS, CONGRUENCY_PROPORTION)
-                state = "fixation"
-                state_time = t
-                random_variant = random.randint(0, 1)
-
-        elif state == "fixation":
-            # nothing clickable
-            if t - state_time >= FIXATION_DURATION:
-                # move to stimulus
-                state = "stimulus"
-                state_time = t
-                stim_onset = t
-                current_word, current_arrow = trials[trial_index]
-                # Choose arrow side variant
-                random_variant = random.randint(0,1)
-
-        elif state == "stimulus":
-            # handle responses
-            response = None
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_LEFT:
-                    response = "LEFT"
-                if event.key == pygame.K_RIGHT:
-                    response = "RIGHT"
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                mpos = event.pos
-                if left_button.clicked(mpos):
-                    response = "LEFT"
-                elif right_button.clicked(mpos):
-                    response = "RIGHT"
-
-            if response is not None:
-                rt = t - stim_onset
-                correct = (response == current_word)  # **CRITICAL**: correctness judged by WORD (not arrow)
-                if correct:
-                    score += 1
-                results.append({
-                    'trial': trial_index + 1,
-                    'word': current_word,
-                    'arrow': current_arrow,
-                    'response': response,
-                    'correct': correct,
-                    'rt': rt,
-                })
-                # go to feedback
-                state = "feedback"
-                state_time = t
-                feedback_text = "Correct!" if correct else "Wrong!"
-                feedback_color = CORRECT_GREEN if correct else WRONG_RED
-
-            # time out (no response)
-            if t - stim_onset >= STIMULUS_DURATION and state == "stimulus":
-                # record miss as wrong with rt = None
-                results.append({
-                    'trial': trial_index + 1,
-                    'word': current_word,
-                    'arrow': current_arrow,
-                    'response': None,
-                    'correct': False,
-                    'rt': None,
-                })
-                state = "feedback"
-                state_time = t
-                feedback_text = "Too Slow!"
-                feedback_color = WRONG_RED
-
-        elif state == "feedback":
-            # wait for FEEDBACK_DURATION then next trial / finish
-            if t - state_time >= FEEDBACK_DURATION:
-                trial_index += 1
-                if trial_index >= TRIALS:
-                    state = "finished"
-                else:
-                    state = "fixation"
-                state_time = t
-
-        elif state == "finished":
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_r:
-                    state = "start"
-                if event.key == pygame.K_q:
-                    running = False
-
-    # Drawing section per state
-    if state == "start":
-        draw_start(screen)
-
-    elif state == "fixation":
-        draw_fixation(screen)
-
-    elif state == "stimulus":
-        # compute time left for display
-        elapsed = t - stim_onset
-        time_left = max(0.0, STIMULUS_DURATION - elapsed)
-        # get current stimulus
-        current_word, current_arrow = trials[trial_index]
-        # draw trial screen with arrow on left or right side (random_variant)
-        # modify draw_trial_screen to use current random_variant arrow side
-        # We'll temporarily set random_variant side and call draw_trial_screen
-        draw_gradient(screen, BG_TOP, BG_BOTTOM)
-        draw_hud(screen, trial_index+1, TRIALS, score)
-        # card
-        card = pygame.Rect(140, 120, SCREEN_SIZE[0]-280, 360)
-        pygame.draw.rect(screen, CARD_COLOR, card, border_radius=18)
-        # word text
-        wtxt = WORD_FONT.render(current_word, True, TEXT_COLOR)
-        screen.blit(wtxt, wtxt.get_rect(center=(SCREEN_SIZE[0]//2, SCREEN_SIZE[1]//2 - 20)))
-        # arrow distractor
-        if SHOW_ARROW:
-            arrow_x = SCREEN_SIZE[0]//2 - 220 if random_variant == 0 else SCREEN_SIZE[0]//2 + 220
-            draw_arrow(screen, (arrow_x, SCREEN_SIZE[1]//2 - 10), 46, current_arrow, color=(60,60,80))
-        # buttons
-        mpos = pygame.mouse.get_pos()
-        left_button.update(mpos)
-        right_button.update(mpos)
-        left_button.draw(screen)
-        right_button.draw(screen)
-        # timer
-        ttxt = SMALL_FONT.render(f"{time_left:.2f}s left", True, TEXT_COLOR)
-        screen.blit(ttxt, (SCREEN_SIZE[0]//2 - 40, SCREEN_SIZE[1]-40))
-
-    elif state == "feedback":
-        # draw the last stimulus faintly
-        draw_gradient(screen, BG_TOP, BG_BOTTOM)
-        draw_hud(screen, trial_index+1, TRIALS, score)
-        card = pygame.Rect(140, 120, SCREEN_SIZE[0]-280, 360)
-        pygame.draw.rect(screen, CARD_COLOR, card, border_radius=18)
-        # show the stimulus faint
-        current = results[-1]
-        wtxt = WORD_FONT.render(current['word'], True, (100,100,110))
-        screen.blit(wtxt, wtxt.get_rect(center=(SCREEN_SIZE[0]//2, SCREEN_SIZE[1]//2 - 20)))
-        if SHOW_ARROW:
-            arrow_x = SCREEN_SIZE[0]//2 - 220 if random_variant == 0 else SCREEN_SIZE[0]//2 + 220
-            draw_arrow(screen, (arrow_x, SCREEN_SIZE[1]//2 - 10), 46, current['arrow'], color=(140,140,150))
-        # feedback overlay
-        last_correct = current['correct']
-        fb_text = "Correct!" if last_correct else ("Too Slow!" if current['response'] is None else "Wrong!")
-        draw_feedback(screen, fb_text, last_correct)
-
-    elif state == "finished":
-        # show end summary
-        draw_gradient(screen, BG_TOP, BG_BOTTOM)
-        title = TITLE_FONT.render("Session complete!", True, CARD_COLOR)
-        screen.blit(title, title.get_rect(center=(SCREEN_SIZE[0]//2, 120)))
-        score_text = SMALL_FONT.render(f"Score: {score} / {TRIALS}", True, CARD_COLOR)
-        screen.blit(score_text, score_text.get_rect(center=(SCREEN_SIZE[0]//2, 180)))
-        avg = calc_avg_rt()
-        lines = [
-            f"Trials: {TRIALS}",
-            f"Average RT (correct): {avg:.3f} s" if avg>0 else "Average RT (correct): N/A",
-            "Press R to restart or Q to quit."
-        ]
-        for i, l in enumerate(lines):
-            screen.blit(SMALL_FONT.render(l, True, CARD_COLOR), (SCREEN_SIZE[0]//2 - 200, 240 + i*40))
-
-    pygame.display.flip()
+        pygame.event.clear()
+    else:
+        for event in pygame.event.get(eventtype=INPUT_EVENTS + [pygame.VIDEOEXPOSE]):
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.VIDEOEXPOSE:
+                dirty = True
+            else:
+                # looked up per event: a handler may have just changed the state
+                handler = _EVENT_HANDLERS.get(state)
+                if handler is not None:
+                    handler(event)
+
+    # Timed transitions (run every frame, independent of input)
+    update = _UPDATE_HANDLERS.get(state)
+    if update is not None:
+        update()
+
+    # Drawing section per state. Only the stimulus screen animates (timer, hover);
+    # every other screen is static, so it is drawn and flipped once on entry.
+    if state != drawn_state or state == "stimulus":
+        dirty = True
+    if dirty:
+        _DRAW_HANDLERS[state]()
+        pygame.display.flip()
+        if state == "stimulus" and drawn_state != "stimulus":
+            # RT is measured from the flip that actually put the stimulus on screen
+            stim_onset = time.perf_counter()
+        dirty = False
+        drawn_state = state
 
 pygame.quit()
 sys.exit()